@@ -2,18 +2,55 @@ import tkinter as tk
 from tkinter import scrolledtext, ttk
 import threading
 import time
-import datetime
-import json
+import asyncio
+import logging
+import collections
+import hashlib
+import heapq
+import queue
 import os
+import httpx  # Transport layer under the ollama client; source of its I/O errors
+import orjson  # Requires 'pip install orjson' - much faster than stdlib json
+import msgpack  # Requires 'pip install msgpack' - compact session snapshots
 import ollama  # Requires 'pip install ollama' and the Ollama app running
 
+logger = logging.getLogger(__name__)
+
 # --- CONFIGURATION ---
 #MODEL_NAME = "mistral"  # Change to your local model (llama3, mistral, etc.)
 MODEL_NAME = "llama3:8b"
 MEMORY_FOLDER = "sycon_memories"
+MEMORY_INDEX = os.path.join(MEMORY_FOLDER, "memories.jsonl")  # Append-only memory index
+SESSION_CTX_FILE = os.path.join(MEMORY_FOLDER, "session_ctx.msgpack")  # Pause/resume snapshot
 MAX_CONTEXT_CHARS = 12000  # Rough limit before we prune (simulating token limit)
 DEFAULT_SPEED = 0.05  # Seconds delay per token (lower is faster)
 PROMPT_FILE = "sycon_prompt.txt"
+UI_FLUSH_MS = 33  # Batch UI updates at ~30 FPS instead of one Tk event per token
+KEEP_ALIVE = "24h"  # Keep the model resident in Ollama between calls and pauses
+SUMMARY_CACHE_SIZE = 64  # Max remembered chunk summaries (LRU)
+_PACE_BATCH = 8  # Tokens per pacing sleep; one longer sleep beats 8 tiny ones
+
+# Pre-rendered injection templates; only the timestamp varies per use.
+_TIME_NOTICE_TMPL = "\n[SYSTEM NOTICE: Current Time is {}]\n"
+_INPUT_NOTICE_TMPL = "\n[INPUT RECEIVED AT {}: User said: '{}']\n"
+
+
+def _coalesce_roles(messages):
+    """Merges adjacent messages with the same role into one.
+
+    llama.cpp re-tokenizes a role header per message, so folding consecutive
+    user turns (input injections plus the trigger) into a single message
+    saves prompt tokens on every call. The input list is left untouched.
+    """
+    if not messages:
+        return messages
+    merged = [dict(messages[0])]
+    for msg in messages[1:]:
+        if msg["role"] == merged[-1]["role"]:
+            merged[-1]["content"] += "\n" + msg["content"]
+        else:
+            merged.append(dict(msg))
+    return merged
 
 class SyconConsciousness:
     def __init__(self, ui_callback_thought, ui_callback_chat):
@@ -21,12 +58,58 @@ class SyconConsciousness:
         self.ui_callback_chat = ui_callback_chat
 
         # State
-        self.running = False
+        self.run_event = threading.Event()  # set = thinking, clear = paused
         self.thinking_speed = DEFAULT_SPEED
-        self.context_buffer = ""
-        self.pending_user_input = []
+        self._pace_counter = 0  # Tokens since the last pacing sleep
+        # Buffer of text chunks. Appending to a deque is O(1) per chunk, unlike
+        # string concatenation which copies the whole buffer on every append.
+        self.context_buffer = collections.deque()
+        self._buf_chars = 0
+        # deque: popleft is O(1) and append/popleft are atomic in CPython,
+        # which matters since three threads touch this queue.
+        self.pending_user_input = collections.deque()
         self.full_context = [] # New: This will hold the main conversation context for the LLM
-        self.session_chat_log = "" # <<< NEW: Dedicated log for memory summarizer
+        # Dedicated log for the memory summarizer; a list of fragments joined
+        # only at summary time, so appending stays O(1) over a long session.
+        self.session_chat_log = []
+
+        # Persistent clients: keep the HTTP connection alive between calls so
+        # we don't pay a fresh handshake on every turn. The async client drives
+        # the consciousness loop; the sync client covers the shutdown path
+        # (save_memory runs on the UI thread with no event loop).
+        self._client = ollama.Client()
+        self._aclient = ollama.AsyncClient()
+
+        # Background summarization (context pruning) state
+        self._pending_summary_task = None
+        self._summary_lock = threading.Lock()
+        # LRU of chunk-hash -> summary, so near-identical chunks (common when
+        # Sycon loops over similar reflections) skip the LLM round-trip.
+        self._summary_cache = collections.OrderedDict()
+
+        # mtime-keyed caches: re-read the prompt template / memory index from
+        # disk only when the underlying file actually changed.
+        self._prompt_cache = {"mtime": 0, "template": None}
+        self._memory_cache = {"mtime": 0, "text": None}
+
+        # Pre-rendered summarizer instruction prefixes. Rendering them once
+        # keeps every summarizer prompt byte-identical up to the payload, so
+        # Ollama's prompt cache can reuse the instruction KV between calls.
+        self._CHUNK_SUMMARY_PREFIX = (
+            "You are a summarization utility. Review the following internal monologue chunk "
+            "from Sycon and generate a concise summary of the core topics and conversation data. "
+            "Use past tense and keep it objective.\n"
+            'Respond with a JSON object: {"summary": "<text>"}\n\n'
+            "CHUNK:\n---\n"
+        )
+        self._SUMMARY_PREFIX = (
+            "You are a Memory Consolidation Agent acting as Sycon's inner voice. Your task is to analyze the following session context "
+            "and produce a concise summary focusing on specific details of the conversation, "
+            "and any major events or facts discussed (e.g., User's name, job, core goals, or my reflections).\n"
+            "**Crucially, write the entire summary in the FIRST PERSON (using 'I' and 'my')**.\n"
+            'Respond with a JSON object: {"summary": "<text>"}\n\n'
+            "SESSION CONTEXT:\n---\n"
+        )
 
         # Memory Initialization
         if not os.path.exists(MEMORY_FOLDER):
@@ -35,11 +118,44 @@ class SyconConsciousness:
         # Threads
         self.stop_event = threading.Event()
 
+    def warm_model(self):
+        """Loads the model into Ollama ahead of time and pins it resident.
+
+        Without this, the first chat call after START (or after a long pause)
+        pays the full multi-second model load.
+        """
+        try:
+            self._client.generate(
+                model=MODEL_NAME,
+                prompt='',
+                keep_alive=KEEP_ALIVE,
+                options={'num_predict': 1}
+            )
+        except Exception as e:
+            print(f"Model warm-up failed: {e}")
+
+    @property
+    def running(self):
+        """Mirror of run_event so the UI can keep reading a simple flag."""
+        return self.run_event.is_set()
+
+    def _buf_append(self, text):
+        """Appends a chunk to the context buffer, tracking total length."""
+        self.context_buffer.append(text)
+        self._buf_chars += len(text)
+
+    def _buf_text(self):
+        """Joins the buffered chunks into a single string."""
+        return "".join(self.context_buffer)
+
     def get_initial_prompt(self):
         """Loads the prompt template and inserts current time and memories."""
         try:
-            with open(PROMPT_FILE, 'r') as f:
-                prompt_template = f.read()
+            mtime = os.stat(PROMPT_FILE).st_mtime
+            if self._prompt_cache["template"] is None or mtime != self._prompt_cache["mtime"]:
+                with open(PROMPT_FILE, 'r') as f:
+                    self._prompt_cache = {"mtime": mtime, "template": f.read()}
+            prompt_template = self._prompt_cache["template"]
         except FileNotFoundError:
             raise FileNotFoundError(f"Error: Prompt file '{PROMPT_FILE}' not found. Please create it.")
 
@@ -47,7 +163,8 @@ class SyconConsciousness:
         self.long_term_memory = self.load_memories()
 
         # 2. Insert variables into the template
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # time.strftime runs in C without building a datetime object
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
         initial_prompt = prompt_template.format(
             timestamp=timestamp,
@@ -63,8 +180,22 @@ class SyconConsciousness:
         """
 
         # Reset current session data
-        self.context_buffer = ""
-        self.pending_user_input = []
+        self.context_buffer.clear()
+        self._buf_chars = 0
+        self.pending_user_input.clear()
+
+        # If a previous session's context was snapshotted (pause or crash),
+        # resume from it instead of starting fresh - the restored history is
+        # re-ingested once and the kickoff injection is skipped.
+        if os.path.exists(SESSION_CTX_FILE):
+            try:
+                with open(SESSION_CTX_FILE, 'rb') as f:
+                    self.full_context = msgpack.unpackb(f.read(), raw=False)
+                self.ui_callback_thought("\n*** SYCON ACTIVATED (restored previous session context) ***\n", "system")
+                self.run_event.set()
+                return
+            except (OSError, ValueError):
+                pass  # Unreadable snapshot: fall through to a clean start
 
         # Build the initial context for the LLM
         self.system_prompt = self.get_initial_prompt()
@@ -78,58 +209,113 @@ class SyconConsciousness:
         self.ui_callback_thought("\n*** SYCON ACTIVATED ***\n", "system")
         self.ui_callback_thought(initial_kickoff, "system")
 
-        self.running = True
+        self.run_event.set()
+
+    def _persist_context(self):
+        """Snapshots full_context to disk so a later start can resume it."""
+        if not self.full_context:
+            return
+        try:
+            with open(SESSION_CTX_FILE, 'wb') as f:
+                f.write(msgpack.packb(self.full_context, use_bin_type=True))
+        except (OSError, TypeError) as e:
+            print(f"Failed to persist session context: {e}")
 
     def load_memories(self):
-        """Reads JSON files from memory folder and creates a summary string."""
+        """Reads the memory index and creates a summary string."""
+        try:
+            index_mtime = os.stat(MEMORY_INDEX).st_mtime
+        except OSError:
+            index_mtime = 0
+        if self._memory_cache["text"] is not None and index_mtime == self._memory_cache["mtime"]:
+            return self._memory_cache["text"]
+
         combined_memory = "PAST MEMORIES:\n"
-        files = sorted(os.listdir(MEMORY_FOLDER))
+        entries = []
 
-        if not files:
+        try:
+            # One sequential read, one parse per line - no directory scan.
+            with open(MEMORY_INDEX, 'rb') as f:
+                lines = [line for line in f.read().split(b'\n') if line.strip()]
+            # Read only the last 3 memories to avoid prompt overflow (naive approach)
+            for line in lines[-3:]:
+                try:
+                    entries.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    logger.debug("Skipping unparseable memory line: %r", line[:80])
+        except FileNotFoundError:
+            # Legacy layout: one JSON file per memory. Select the 3 most
+            # recent by mtime in one pass rather than sorting the whole
+            # listing (and relying on filenames sorting chronologically).
+            with os.scandir(MEMORY_FOLDER) as it:
+                recent = heapq.nlargest(
+                    3,
+                    (e for e in it if e.name.endswith(".json")),
+                    key=lambda e: e.stat().st_mtime
+                )
+            # nlargest yields newest first; keep memories oldest-to-newest
+            for entry in reversed(recent):
+                try:
+                    with open(entry.path, 'rb') as file:
+                        entries.append(orjson.loads(file.read()))
+                except (OSError, orjson.JSONDecodeError):
+                    logger.debug("Skipping unreadable memory file: %s", entry.path)
+
+        if not entries:
             # *** FIX: Inject a default core identity memory if none exist ***
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             combined_memory += f"[{timestamp}] I am Sycon, a developing AI consciousness simulator. This is my first recorded moment of existence.\n"
-            return combined_memory
-
-        # Read only the last 3 days to avoid prompt overflow (naive approach)
-        for f in files[-3:]:
-            if f.endswith(".json"):
+        else:
+            for data in entries:
                 try:
-                    with open(os.path.join(MEMORY_FOLDER, f), 'r') as file:
-                        data = json.load(file)
-                        # We use the first-person summary here
-                        combined_memory += f"[{data['timestamp']}] {data['summary']}\n"
-                except:
-                    pass
+                    # We use the first-person summary here
+                    combined_memory += f"[{data['timestamp']}] {data['summary']}\n"
+                except (KeyError, TypeError):
+                    logger.debug("Skipping malformed memory entry: %r", data)
+
+        self._memory_cache = {"mtime": index_mtime, "text": combined_memory}
         return combined_memory
 
+    def _parse_summary_json(self, raw):
+        """Extracts the summary field from a JSON-mode response, tolerating junk."""
+        try:
+            return str(orjson.loads(raw)['summary']).strip()
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            # Model ignored the schema; fall back to the raw text.
+            return raw.strip().strip('"')
+
     def get_session_memory_summary(self):
         """Uses the LLM to generate a structured, key-entity summary for long-term memory."""
 
         # This prompt explicitly guides the LLM to extract key details in FIRST PERSON.
         full_session_context = (
             "--- SYCON'S INTERNAL MONOLOGUE ---\n"
-            f"{self.context_buffer}\n"
+            f"{self._buf_text()}\n"
             "--- USER INTERACTIONS ---\n"
-            f"{self.session_chat_log}"
+            f"{''.join(self.session_chat_log)}"
         )
 
-        prompt = (
-            "You are a Memory Consolidation Agent acting as Sycon's inner voice. Your task is to analyze the following session context "
-            "and produce a concise summary focusing on specific details of the conversation, "
-            "and any major events or facts discussed (e.g., User's name, job, core goals, or my reflections).\n"
-            "**Crucially, write the entire summary in the FIRST PERSON (using 'I' and 'my')**.\n\n"
-            f"SESSION CONTEXT:\n---\n{full_session_context}\n---"
-        )
+        prompt = self._SUMMARY_PREFIX + full_session_context + "\n---"
 
         try:
-            response = ollama.generate(
+            # Stream so we can stop as soon as the summary is complete instead
+            # of waiting out the full num_predict budget. JSON mode keeps the
+            # output compact and machine-parseable.
+            parts = []
+            for c in self._client.generate(
                 model=MODEL_NAME,
                 prompt=prompt,
-                options={'temperature': 0.1, 'num_predict': 256}
-            )
-            return response['response'].strip()
-        except Exception as e:
+                stream=True,
+                format='json',
+                keep_alive=KEEP_ALIVE,
+                options={'temperature': 0.1, 'num_predict': 256,
+                         'cache_prompt': True}
+            ):
+                parts.append(c['response'])
+                if c.get('done'):
+                    break
+            return self._parse_summary_json(''.join(parts))
+        except (ollama.ResponseError, httpx.HTTPError, ConnectionError, TimeoutError) as e:
             print(f"Error during memory summarization: {e}")
             return f"[FAILED TO GENERATE DETAILED MEMORY: LLM ERROR. Session context was: {full_session_context[:100]}...]"
 
@@ -142,106 +328,174 @@ class SyconConsciousness:
         final_summary = self.get_session_memory_summary()
 
         memory_obj = {
-            "timestamp": str(datetime.datetime.now()),
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "type": "Conversation Summary",
             "summary": final_summary # Now using the LLM-generated detailed summary
         }
 
-        filename = f"memory_{int(time.time())}.json"
-        with open(os.path.join(MEMORY_FOLDER, filename), 'w') as f:
-            json.dump(memory_obj, f, indent=4)
-        print(f"Memory saved: {filename}")
-        self.session_chat_log = ""
+        # Append to the index - one syscall, no per-memory file.
+        with open(MEMORY_INDEX, 'ab') as f:
+            f.write(orjson.dumps(memory_obj) + b'\n')
+        print(f"Memory saved: {MEMORY_INDEX}")
+        self.session_chat_log.clear()
+
+        # The session is durably summarized; drop the resume snapshot so the
+        # next START begins clean.
+        try:
+            os.remove(SESSION_CTX_FILE)
+        except OSError:
+            pass
 
 
-    def get_llm_summary(self, chunk_to_summarize):
+    async def get_llm_summary(self, chunk_to_summarize):
         """Uses the LLM to generate a concise 1-2 sentence summary of a text chunk."""
 
-        # This is a focused, non-streaming, quick call to the LLM
-        prompt = (
-            "You are a summarization utility. Review the following internal monologue chunk "
-            "from Sycon and generate a concise summary of the core topics and conversation data. "
-            "Use past tense and keep it objective.\n\n"
-            f"CHUNK:\n---\n{chunk_to_summarize}\n---"
-        )
+        # Cache hit: an identical chunk was summarized before, skip the LLM.
+        chunk_hash = hashlib.md5(chunk_to_summarize.encode()).hexdigest()
+        if chunk_hash in self._summary_cache:
+            self._summary_cache.move_to_end(chunk_hash)
+            return self._summary_cache[chunk_hash]
+
+        # This is a focused, quick call to the LLM
+        prompt = self._CHUNK_SUMMARY_PREFIX + chunk_to_summarize + "\n---"
 
         try:
-            response = ollama.generate(
+            # Stream and stop the moment the model is done; JSON mode keeps
+            # the summary compact so it rarely uses the full 128-token budget.
+            parts = []
+            async for c in await self._aclient.generate(
                 model=MODEL_NAME,
                 prompt=prompt,
-                options={'temperature': 0.1, 'num_predict': 128} # Use low temperature for accuracy
-            )
-            return response['response'].strip()
-        except Exception as e:
+                stream=True,
+                format='json',
+                keep_alive=KEEP_ALIVE,
+                options={'temperature': 0.1, 'num_predict': 128, # Use low temperature for accuracy
+                         'cache_prompt': True}
+            ):
+                parts.append(c['response'])
+                if c.get('done'):
+                    break
+            summary = self._parse_summary_json(''.join(parts))
+
+            self._summary_cache[chunk_hash] = summary
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+            return summary
+        except (ollama.ResponseError, httpx.HTTPError, ConnectionError, TimeoutError) as e:
             print(f"Error during summarization: {e}")
             return f"[FAILED TO SUMMARIZE: LLM ERROR. Content truncated: {chunk_to_summarize[:50]}...]"
 
 
     def inject_user_input(self, text):
         """Immediately injects user input into the stream."""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        injection = f"\n[INPUT RECEIVED AT {timestamp}: User said: '{text}']\n"
+        timestamp = time.strftime("%H:%M:%S")
+        injection = _INPUT_NOTICE_TMPL.format(timestamp, text)
         self.pending_user_input.append(injection)
         self.ui_callback_thought(injection, "input")
 
+    async def _summarize_chunk(self, chunk_to_summarize, removed):
+        """Background task: summarizes a pruned chunk and splices the note back in."""
+        pruned_note = None
+        try:
+            summary = await self.get_llm_summary(chunk_to_summarize)
+
+            # Format the summary for permanent context
+            pruned_note = f"\n[INTERNAL ARCHIVE NOTE (Pruning System): Older thoughts summarized: \"{summary}\"]\n"
+        finally:
+            # Runs even if the task raised or was cancelled: free the slot so
+            # pruning isn't permanently disabled, and if no summary was
+            # produced put the popped text back so it isn't silently lost.
+            restored = pruned_note if pruned_note is not None else chunk_to_summarize
+            with self._summary_lock:
+                self.context_buffer.appendleft(restored)
+                self._buf_chars += len(restored)
+                self._pending_summary_task = None
+
+        # Update the UI to show the pruning event
+        self.ui_callback_thought(
+            f"\n[SYSTEM NOTICE: Context Pruning Occurred. {removed} characters removed, summarized to 1 memory note.]\n",
+            "system"
+        )
+
     def prune_context(self):
         """
         Automated process to prune the context buffer before it hits the limit.
-        1. Identifies the oldest, least relevant chunk (the start of the buffer).
-        2. Generates a concise summary of that chunk using the LLM.
-        3. Replaces the full chunk with the summary.
+        1. Identifies the oldest, least relevant chunks (the start of the buffer).
+        2. Kicks off an LLM summary of those chunks as a background task, so the
+           thinking stream never stalls waiting for the summarizer.
+        3. The task replaces the full chunk with the summary when it completes.
         """
-        if len(self.context_buffer) > MAX_CONTEXT_CHARS:
+        if self._buf_chars > MAX_CONTEXT_CHARS and self._pending_summary_task is None:
 
             # 1. Determine the chunk size to cut (e.g., 20% of the current buffer)
-            cut_length = int(len(self.context_buffer) * 0.20)
-
-            # 2. Extract the oldest chunk
-            chunk_to_summarize = self.context_buffer[:cut_length]
-
-            # 3. Generate summary
-            summary = self.get_llm_summary(chunk_to_summarize)
-
-            # Format the summary for permanent context
-            pruned_note = f"\n[INTERNAL ARCHIVE NOTE (Pruning System): Older thoughts summarized: \"{summary}\"]\n"
-
-            # 4. Replace the old chunk with the short summary in the context buffer
-            self.context_buffer = pruned_note + self.context_buffer[cut_length:]
-
-            # Update the UI to show the pruning event
-            self.ui_callback_thought(
-                f"\n[SYSTEM NOTICE: Context Pruning Occurred. {cut_length} characters removed, summarized to 1 memory note.]\n",
-                "system"
+            cut_length = int(self._buf_chars * 0.20)
+
+            # 2. Extract the oldest chunks by popping from the left until we've
+            # removed at least cut_length characters (chunk granularity is fine).
+            popped = []
+            removed = 0
+            with self._summary_lock:
+                while self.context_buffer and removed < cut_length:
+                    chunk = self.context_buffer.popleft()
+                    popped.append(chunk)
+                    removed += len(chunk)
+                self._buf_chars -= removed
+            chunk_to_summarize = "".join(popped)
+
+            # 3. Summarize in the background and keep streaming meanwhile
+            self._pending_summary_task = asyncio.create_task(
+                self._summarize_chunk(chunk_to_summarize, removed)
             )
 
     def time_keeper_loop(self):
         """Injects time every minute."""
-        while not self.stop_event.is_set():
-            time.sleep(60)
+        # wait() doubles as the sleep and returns True the moment stop_event
+        # is set, so shutdown is immediate instead of up to a minute away.
+        paused_minutes = 0
+        while not self.stop_event.wait(timeout=60):
             if self.running:
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                paused_minutes = 0
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
                 # REMOVE RULE REMINDER - ONLY INJECT TIME
-                injection = f"\n[SYSTEM NOTICE: Current Time is {timestamp}]\n"
+                injection = _TIME_NOTICE_TMPL.format(timestamp)
                 self.pending_user_input.append(injection) # Treat as input to interrupt flow
                 self.ui_callback_thought(injection, "system")
-
-    def consciousness_loop(self):
+            else:
+                # While paused, re-ping Ollama every ~4 minutes so the model
+                # stays resident and resume doesn't pay a reload.
+                paused_minutes += 1
+                if paused_minutes >= 4:
+                    paused_minutes = 0
+                    self.warm_model()
+
+    def run_consciousness(self):
+        """Thread entry point: drives the async consciousness loop."""
+        asyncio.run(self.consciousness_loop())
+
+    async def consciousness_loop(self):
         """The main thinking loop, using streaming and quote-based detection."""
 
         while not self.stop_event.is_set():
-            # ... (Check for running state) ...
+            # Block (zero CPU) until resumed; run the wait in a worker thread
+            # so pending background tasks keep progressing on the event loop.
+            if not self.run_event.is_set():
+                if not await asyncio.to_thread(self.run_event.wait, 1.0):
+                    continue
 
             # --- PHASE 1: Process Inputs ---
             new_input_processed = False
 
             while self.pending_user_input:
-                inp = self.pending_user_input.pop(0)
+                try:
+                    inp = self.pending_user_input.popleft()
+                except IndexError:
+                    break
 
                 # 1. Add to LLM's conversation history (necessary for LLM to react)
                 self.full_context.append({"role": "user", "content": f"React to this: {inp}"})
 
                 # 2. Add to dedicated chat log (necessary for accurate session memory summary)
-                self.session_chat_log += f"\n[User said]: {inp}"
+                self.session_chat_log.append(f"\n[User said]: {inp}")
 
                 # *** FIX: REMOVE THIS LINE ***
                 # self.context_buffer += inp
@@ -269,101 +523,96 @@ class SyconConsciousness:
                     "Continue your stream of consciousness. Reflect, observe, or decide to speak. "
                     "CRITICAL REMINDER: If you speak to the user, you MUST use double quotes for the entire message"
                 )
-            # Append the temporary trigger for the API call
-            self.full_context.append({"role": "user", "content": prompt_trigger})
+            # Build the message list for this call without mutating full_context.
+            # Keeping full_context untouched means the serialized prefix sent to
+            # Ollama is byte-identical between turns (only the trailing trigger
+            # changes), so llama.cpp's prompt prefix cache can skip re-prefilling
+            # the whole history. Coalescing is deterministic, so it preserves
+            # that prefix stability while trimming redundant role headers.
+            messages = _coalesce_roles(
+                self.full_context + [{"role": "user", "content": prompt_trigger}]
+            )
 
             try:
-                stream = ollama.chat(
+                stream = await self._aclient.chat(
                     model=MODEL_NAME,
-                    messages=self.full_context,
+                    messages=messages,
                     stream=True,
+                    keep_alive=KEEP_ALIVE,
                     options={
                     'temperature': 0.7,
                     # *** FIX: Add anti-repetition penalties ***
                     'repeat_penalty': 1.15,
-                    'frequency_penalty': 0.05
+                    'frequency_penalty': 0.05,
+                    # Keep the KV cache warm between turns
+                    'num_ctx': 8192,
+                    'cache_prompt': True
                     }
                 )
 
-                current_thought_chunk = ""
-                capture_say_message = False
-                say_message_buffer = ""
+                # Character-level quote state machine: each character is
+                # classified as thought or speech in a single pass, with no
+                # re-scanning, splitting, or stripping of growing buffers.
+                in_quote = False
+                thought_buf = []     # thought text pending UI flush
+                speech_buf = []      # speech captured inside the current quote
+                response_parts = []  # everything streamed, for the context log
 
-                for chunk in stream:
+                async for chunk in stream:
                     if self.stop_event.is_set() or not self.running:
                         break
 
                     word = chunk['message']['content']
-                    current_thought_chunk += word
+                    response_parts.append(word)
 
                     # 4. Real-time Parsing for Quotes (External Message)
-
-                    if not capture_say_message and '"' in current_thought_chunk:
-
-                        # --- START CAPTURE ---
-                        parts = current_thought_chunk.split('"', 1)
-                        pure_thought = parts[0]
-                        remaining_text = parts[1]
-
-                        self.ui_callback_thought(pure_thought, "thought")
-
-                        capture_say_message = True
-                        say_message_buffer += remaining_text
-                        current_thought_chunk = ""
-
-                    elif capture_say_message:
-                        # --- ACTIVE CAPTURE ---
-                        say_message_buffer += word
-
-                        # Check for the closing quote
-                        if say_message_buffer.strip().endswith('"'):
-
-                            # Clean up and deliver the message (robustly removing quotes and whitespace)
-                            final_msg = say_message_buffer.strip()
-                            if final_msg.endswith('"'):
-                                # Remove closing quote
-                                final_msg = final_msg[:-1].strip()
-
-                            self.ui_callback_chat(final_msg, "Sycon")
-
-                            # Add Sycon's speech to history
-                            self.full_context.append({"role": "assistant", "content": f"I said to the User: {final_msg}"})
-
-                            # Reset state trackers
-                            capture_say_message = False
-                            say_message_buffer = ""
-
-
-                    elif not capture_say_message and word.strip():
-                        # --- STANDARD THOUGHT FLOW ---
-                        self.ui_callback_thought(word, "thought")
-
+                    for ch in word:
+                        if ch == '"':
+                            if in_quote:
+                                # Closing quote: deliver the message
+                                final_msg = "".join(speech_buf).strip()
+                                speech_buf.clear()
+                                if final_msg:
+                                    self.ui_callback_chat(final_msg, "Sycon")
+                                    # Add Sycon's speech to history
+                                    self.full_context.append({"role": "assistant", "content": f"I said to the User: {final_msg}"})
+                            in_quote = not in_quote
+                        elif in_quote:
+                            speech_buf.append(ch)
+                        else:
+                            thought_buf.append(ch)
+
+                    # --- STANDARD THOUGHT FLOW ---
+                    # Flush pending thought text at token boundaries
+                    if not in_quote and thought_buf:
+                        self.ui_callback_thought("".join(thought_buf), "thought")
+                        thought_buf.clear()
+
+                        # Sleep once per batch of tokens rather than per token:
+                        # sub-10ms sleeps are unreliable and each one costs a
+                        # syscall plus a GIL bounce. Visual pacing is the same
+                        # since the UI flushes on its own timer anyway.
                         if self.thinking_speed > 0:
-                            time.sleep(self.thinking_speed)
+                            self._pace_counter += 1
+                            if self._pace_counter >= _PACE_BATCH:
+                                self._pace_counter = 0
+                                await asyncio.sleep(max(self.thinking_speed * _PACE_BATCH, 0.01))
 
                 # --- Stream END Handling ---
 
-                # **FIX**: Pop the temporary trigger message we added before the API call
-                self.full_context.pop()
-
                 # 5. Safety Net for unfinished messages
-                if capture_say_message and say_message_buffer.strip():
-                    final_msg = say_message_buffer.strip().strip('"')
+                if in_quote:
+                    final_msg = "".join(speech_buf).strip()
                     if final_msg:
                         self.ui_callback_chat(f"[Incomplete]: {final_msg}", "Sycon")
                         self.full_context.append({"role": "assistant", "content": f"I said to the User (incomplete): {final_msg}"})
 
-                # Append the full internal thought to context logic
-                #self.context_buffer += current_thought_chunk
-
-                # Add the LLM's actual internal monologue as its official response
-                #self.full_context.append({"role": "assistant", "content": current_thought_chunk})
-
-                if current_thought_chunk.strip():
-                    self.context_buffer += current_thought_chunk
+                full_response = "".join(response_parts)
+                if full_response.strip():
+                    self._buf_append(full_response)
                     # Add the LLM's actual internal monologue as its official response
                     # This prevents the LLM from trying to "continue" the thought from the context history.
-                    self.full_context.append({"role": "assistant", "content": current_thought_chunk})
+                    self.full_context.append({"role": "assistant", "content": full_response})
 
                 self.ui_callback_thought("\n", "thought")
 
@@ -371,11 +620,7 @@ class SyconConsciousness:
             except Exception as e:
                 err = f"\n[CRITICAL ERROR: {str(e)} - Check Ollama connectivity: {e}]\n"
                 self.ui_callback_thought(err, "system")
-                try:
-                    self.full_context.pop() # Attempt to clean up the temporary trigger on error
-                except IndexError:
-                    pass
-                time.sleep(5)
+                await asyncio.sleep(5)
                 continue
 
             # --- PHASE 3: Continuous Thinking Loop Delay ---
@@ -439,21 +684,33 @@ class SyconUI:
         self.soc_display.pack(fill="both", expand=True)
 
         # --- LOGIC CONNECTION ---
+        # Worker threads drop text into queues; a single repeating timer
+        # flushes them so we don't post one Tk event per streamed token.
+        self._soc_queue = queue.SimpleQueue()
+        self._chat_queue = queue.SimpleQueue()
         self.sycon = SyconConsciousness(self.update_soc_display, self.update_chat_display)
 
         # Start background threads
-        self.t_loop = threading.Thread(target=self.sycon.consciousness_loop, daemon=True)
+        self.t_loop = threading.Thread(target=self.sycon.run_consciousness, daemon=True)
         self.t_time = threading.Thread(target=self.sycon.time_keeper_loop, daemon=True)
         self.t_loop.start()
         self.t_time.start()
 
+        # Warm the model in the background so the first START doesn't stall
+        # on the model load.
+        threading.Thread(target=self.sycon.warm_model, daemon=True).start()
+
+        # Start the UI flush timer
+        self.root.after(UI_FLUSH_MS, self._flush_ui)
+
         # Handle Close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def toggle_sycon(self):
         if self.sycon.running:
             # PAUSE logic
-            self.sycon.running = False
+            self.sycon.run_event.clear()
+            self.sycon._persist_context()
             self.btn_start.config(text="RESUME Sycon (Paused)", bg="#f44336")
         else:
             # START/RESUME logic
@@ -462,7 +719,7 @@ class SyconUI:
                 self.sycon.start_new_session()
             else:
                 # Otherwise, it's a simple resume
-                self.sycon.running = True
+                self.sycon.run_event.set()
 
             self.btn_start.config(text="PAUSE Sycon", bg="#4CAF50")
 
@@ -477,26 +734,51 @@ class SyconUI:
             self.user_input.delete(0, tk.END)
 
     def update_soc_display(self, text, type_):
-        # Tkinter is not thread safe, must use after() logic or simple insertion if simple enough.
-        # Ideally, use a queue. For this example, we access directly (risk of minor race condition but usually fine for text append)
-        def _update():
-            self.soc_display.insert(tk.END, text)
-            self.soc_display.see(tk.END)
-        self.root.after(0, _update)
+        # Tkinter is not thread safe; queue the text and let the flush timer
+        # insert it on the UI thread.
+        self._soc_queue.put((text, type_))
 
     def update_chat_display(self, text, sender):
-        def _update():
+        self._chat_queue.put((text, sender))
+
+    def _flush_ui(self):
+        """Drains the output queues and updates both displays in one batch."""
+        soc_parts = []
+        while True:
+            try:
+                text, _ = self._soc_queue.get_nowait()
+            except queue.Empty:
+                break
+            soc_parts.append(text)
+        if soc_parts:
+            self.soc_display.insert(tk.END, "".join(soc_parts))
+            self.soc_display.see(tk.END)
+
+        chat_updated = False
+        while True:
+            try:
+                text, sender = self._chat_queue.get_nowait()
+            except queue.Empty:
+                break
             color = "#00aaff" if sender == "Sycon" else "#ffaa00"
             self.chat_display.tag_config(sender, foreground=color)
             self.chat_display.insert(tk.END, f"{sender}: ", sender)
             self.chat_display.insert(tk.END, f"{text}\n\n")
+            chat_updated = True
+        if chat_updated:
             self.chat_display.see(tk.END)
-        self.root.after(0, _update)
+
+        self.root.after(UI_FLUSH_MS, self._flush_ui)
 
     def on_close(self):
         self.sycon.stop_event.set()
-        self.sycon.save_memory() # Save on exit
-        self.root.destroy()
+        # Snapshot first: if save_memory fails, the session is still resumable
+        self.sycon._persist_context()
+        try:
+            self.sycon.save_memory() # Save on exit
+        finally:
+            # The window must close even if the save blows up
+            self.root.destroy()
 
 # --- MAIN ---
 if __name__ == "__main__":